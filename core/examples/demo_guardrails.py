@@ -28,9 +28,13 @@ from framework.runtime.agent_runtime import (
     EntryPointSpec,
     create_agent_runtime,
 )
+from framework.runtime.cancellation import CancellationToken
 from framework.runtime.event_bus import EventType
 from framework.runtime.execution_guard import ExecutionLimitConfig
-from framework.storage.concurrent import ConcurrentStorage
+from framework.storage.concurrent import get_shared_storage
+
+# Storage self-provisions its directory layout on construction
+STORAGE_PATH = Path("./demo_guardrails_storage")
 
 
 class SlowLLMProvider(LLMProvider):
@@ -44,9 +48,11 @@ class SlowLLMProvider(LLMProvider):
         max_tokens: int = 1024,
         response_format: dict | None = None,
         json_mode: bool = False,
+        cancellation_token: CancellationToken | None = None,
     ) -> LLMResponse:
-        # Sleep 3s so runtime limit (2s) is exceeded
-        time.sleep(3)
+        # "Sleep" 3s so runtime limit (2s) is exceeded; waiting on the token
+        # lets the guard interrupt the sleep the moment it fires
+        self._sleep(3, cancellation_token)
         return LLMResponse(content=json.dumps({"result": "ok"}), model="slow")
 
     def complete_with_tools(
@@ -56,23 +62,35 @@ class SlowLLMProvider(LLMProvider):
         tools: list[Tool],
         tool_executor: Callable,
         max_iterations: int = 10,
+        cancellation_token: CancellationToken | None = None,
     ) -> LLMResponse:
-        time.sleep(3)
+        self._sleep(3, cancellation_token)
         return LLMResponse(content=json.dumps({"result": "ok"}), model="slow")
 
+    @staticmethod
+    def _sleep(seconds: float, cancellation_token: CancellationToken | None) -> None:
+        """Sleep cooperatively: exit early if the guard cancels the token."""
+        if cancellation_token is not None:
+            cancellation_token.wait(seconds)
+        else:
+            time.sleep(seconds)
+
+
+async def on_started(event):
+    """Print execution started (called by event bus)."""
+    print(f"\n  ▶ EXECUTION_STARTED  execution_id={event.execution_id}")
+
 
-async def on_event(event):
-    """Print events (called by event bus)."""
-    if event.type == EventType.EXECUTION_TERMINATED:
-        print("\n  🔴 GUARD FIRED: EXECUTION_TERMINATED")
-        print(f"     reason: {event.data.get('reason', '?')}")
-        print(f"     details: {event.data.get('details', {})}")
-    elif event.type == EventType.EXECUTION_STARTED:
-        print(f"\n  ▶ EXECUTION_STARTED  execution_id={event.execution_id}")
-    elif event.type == EventType.EXECUTION_COMPLETED:
-        print(f"  ✓ EXECUTION_COMPLETED execution_id={event.execution_id}")
-    else:
-        print(f"  • {event.type.value}  execution_id={event.execution_id}")
+async def on_terminated(event):
+    """Print guard termination (called by event bus)."""
+    print("\n  🔴 GUARD FIRED: EXECUTION_TERMINATED")
+    print(f"     reason: {event.data.get('reason', '?')}")
+    print(f"     details: {event.data.get('details', {})}")
+
+
+async def on_completed(event):
+    """Print execution completed (called by event bus)."""
+    print(f"  ✓ EXECUTION_COMPLETED execution_id={event.execution_id}")
 
 
 async def main():
@@ -124,15 +142,13 @@ async def main():
     guard_config = ExecutionLimitConfig(max_runtime_ms=2000)
     config = AgentRuntimeConfig(execution_guard_config=guard_config)
 
-    storage_path = Path("./demo_guardrails_storage")
-    storage_path.mkdir(exist_ok=True)
-    storage = ConcurrentStorage(storage_path)
-    await storage.start()
+    storage = get_shared_storage(STORAGE_PATH)
+    await storage.ensure_started()
 
     runtime = create_agent_runtime(
         graph=graph,
         goal=goal,
-        storage_path=storage_path,
+        storage_path=STORAGE_PATH,
         entry_points=[
             EntryPointSpec(
                 id="demo",
@@ -144,16 +160,17 @@ async def main():
         ],
         llm=SlowLLMProvider(),
         config=config,
+        storage=storage,
     )
 
-    # Subscribe so we see EXECUTION_TERMINATED when guard fires
+    # Subscribe so we see EXECUTION_TERMINATED when guard fires;
+    # each event type dispatches straight to its own handler
     runtime.subscribe_to_events(
-        event_types=[
-            EventType.EXECUTION_STARTED,
-            EventType.EXECUTION_TERMINATED,
-            EventType.EXECUTION_COMPLETED,
-        ],
-        handler=on_event,
+        handlers={
+            EventType.EXECUTION_STARTED: on_started,
+            EventType.EXECUTION_TERMINATED: on_terminated,
+            EventType.EXECUTION_COMPLETED: on_completed,
+        },
     )
 
     await runtime.start()
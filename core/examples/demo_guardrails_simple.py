@@ -7,7 +7,7 @@ Run from repo root:
     PYTHONPATH=core python core/examples/demo_guardrails_simple.py
 """
 
-import time
+import threading
 
 from framework.runtime.execution_guard import (
     ExecutionGuard,
@@ -37,7 +37,8 @@ def main():
     config2 = ExecutionLimitConfig(max_runtime_ms=150)
     guard2 = ExecutionGuard("demo-2", config2)
     print("   Waiting 200ms...")
-    time.sleep(0.2)
+    # Event-based wait aborts cleanly on Ctrl-C, unlike time.sleep
+    threading.Event().wait(0.2)
     result2 = guard2.check_all_limits()
     if result2.should_terminate:
         print(f"   GUARD FIRED — {result2.reason} {result2.details}")
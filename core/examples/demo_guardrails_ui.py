@@ -13,66 +13,82 @@ Run from repo root:
 Then open http://localhost:8501 and click "Run guardrails demo".
 """
 
+from __future__ import annotations
+
 import asyncio
 import json
 import time
 from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 
 import streamlit as st
 
-from framework.graph import Goal, NodeSpec, SuccessCriterion
-from framework.graph.edge import GraphSpec
-from framework.llm.provider import LLMProvider, LLMResponse, Tool
-from framework.runtime.agent_runtime import (
-    AgentRuntimeConfig,
-    EntryPointSpec,
-    create_agent_runtime,
-)
-from framework.runtime.event_bus import EventType
-from framework.runtime.execution_guard import ExecutionLimitConfig
-from framework.storage.concurrent import ConcurrentStorage
-
-
-class SlowLLMProvider(LLMProvider):
-    """LLM that sleeps so execution runs long enough for guard to fire."""
-
-    def complete(
-        self,
-        messages: list[dict],
-        system: str = "",
-        tools: list[Tool] | None = None,
-        max_tokens: int = 1024,
-        response_format: dict | None = None,
-        json_mode: bool = False,
-    ) -> LLMResponse:
-        time.sleep(3)
-        return LLMResponse(content=json.dumps({"result": "ok"}), model="slow")
-
-    def complete_with_tools(
-        self,
-        messages: list[dict],
-        system: str,
-        tools: list[Tool],
-        tool_executor: Callable,
-        max_iterations: int = 10,
-    ) -> LLMResponse:
-        time.sleep(3)
-        return LLMResponse(content=json.dumps({"result": "ok"}), model="slow")
-
-
-async def run_demo(events_out: list):
-    """Run guardrails demo and append events to events_out."""
-
-    async def on_event(event):
-        events_out.append(
-            {
-                "type": event.type.value,
-                "execution_id": event.execution_id,
-                "stream_id": event.stream_id,
-                "data": getattr(event, "data", {}),
-            }
-        )
+STORAGE_PATH = Path("./demo_guardrails_storage")
+
+
+@lru_cache(maxsize=1)
+def _get_provider_cls():
+    """Build the SlowLLMProvider class on first use.
+
+    Framework imports are deferred so `streamlit run` only pays their cost
+    once the user actually clicks "Run", keeping page startup snappy.
+    """
+    from framework.llm.provider import LLMProvider, LLMResponse, Tool
+    from framework.runtime.cancellation import CancellationToken
+
+    class SlowLLMProvider(LLMProvider):
+        """LLM that sleeps so execution runs long enough for guard to fire."""
+
+        def complete(
+            self,
+            messages: list[dict],
+            system: str = "",
+            tools: list[Tool] | None = None,
+            max_tokens: int = 1024,
+            response_format: dict | None = None,
+            json_mode: bool = False,
+            cancellation_token: CancellationToken | None = None,
+        ) -> LLMResponse:
+            self._sleep(3, cancellation_token)
+            return LLMResponse(content=json.dumps({"result": "ok"}), model="slow")
+
+        def complete_with_tools(
+            self,
+            messages: list[dict],
+            system: str,
+            tools: list[Tool],
+            tool_executor: Callable,
+            max_iterations: int = 10,
+            cancellation_token: CancellationToken | None = None,
+        ) -> LLMResponse:
+            self._sleep(3, cancellation_token)
+            return LLMResponse(content=json.dumps({"result": "ok"}), model="slow")
+
+        @staticmethod
+        def _sleep(seconds: float, cancellation_token: CancellationToken | None) -> None:
+            """Sleep cooperatively: exit early if the guard cancels the token."""
+            if cancellation_token is not None:
+                cancellation_token.wait(seconds)
+            else:
+                time.sleep(seconds)
+
+    return SlowLLMProvider
+
+
+@st.cache_resource
+def build_spec():
+    """Build the demo's static objects once per Streamlit session.
+
+    Goal/graph specs, runtime config, and the storage instance are pure
+    setup; rebuilding them on every button click just re-runs Pydantic
+    validation and filesystem setup before the guard even arms.
+    """
+    from framework.graph import Goal, NodeSpec, SuccessCriterion
+    from framework.graph.edge import GraphSpec
+    from framework.runtime.agent_runtime import AgentRuntimeConfig
+    from framework.runtime.execution_guard import ExecutionLimitConfig
+    from framework.storage.concurrent import get_shared_storage
 
     goal = Goal(
         id="demo-goal",
@@ -116,10 +132,25 @@ async def run_demo(events_out: list):
     guard_config = ExecutionLimitConfig(max_runtime_ms=2000)
     config = AgentRuntimeConfig(execution_guard_config=guard_config)
 
-    storage_path = Path("./demo_guardrails_storage")
-    storage_path.mkdir(exist_ok=True)
-    storage = ConcurrentStorage(storage_path)
-    await storage.start()
+    # Storage self-provisions its directory layout on construction;
+    # the shared instance survives across button clicks
+    storage_path = STORAGE_PATH
+    storage = get_shared_storage(storage_path)
+
+    return goal, graph, config, storage_path, storage
+
+
+async def run_demo(events_out: list, goal, graph, config, storage_path, storage):
+    """Run guardrails demo and append events to events_out."""
+    from framework.runtime.agent_runtime import EntryPointSpec, create_agent_runtime
+    from framework.runtime.event_bus import EventType
+
+    async def on_event(event):
+        # Reuse the event's cached serialization rather than rebuilding
+        # a payload dict per subscriber
+        events_out.append(json.loads(event.json_bytes))
+
+    await storage.ensure_started()
 
     runtime = create_agent_runtime(
         graph=graph,
@@ -134,8 +165,9 @@ async def run_demo(events_out: list):
                 isolation_level="shared",
             )
         ],
-        llm=SlowLLMProvider(),
+        llm=_get_provider_cls()(),
         config=config,
+        storage=storage,
     )
 
     runtime.subscribe_to_events(
@@ -150,6 +182,10 @@ async def run_demo(events_out: list):
     await runtime.start()
     await runtime.trigger_and_wait("demo", {"x": "test"}, timeout=10)
     await runtime.stop()
+    # Each click runs in its own asyncio.run loop, so the batch writer
+    # must be stopped (flushed) with this loop. The shared instance's
+    # read cache survives across clicks; ensure_started() rebuilds the
+    # loop-bound state and respawns the writer on the next run.
     await storage.stop()
 
 
@@ -162,8 +198,9 @@ st.caption(
 
 if st.button("Run guardrails demo"):
     events: list = []
+    goal, graph, config, storage_path, storage = build_spec()
     with st.spinner("Running... (guard will fire after ~2s)"):
-        asyncio.run(run_demo(events))
+        asyncio.run(run_demo(events, goal, graph, config, storage_path, storage))
 
     st.success("Done.")
     st.subheader("Events")
@@ -30,6 +30,7 @@ from framework.graph.node import (
 from framework.graph.output_cleaner import CleansingConfig, OutputCleaner
 from framework.graph.validator import OutputValidator
 from framework.llm.provider import LLMProvider, Tool
+from framework.runtime.cancellation import CancellationToken
 from framework.runtime.core import Runtime
 
 
@@ -107,6 +108,7 @@ class GraphExecutor:
         cleansing_config: CleansingConfig | None = None,
         enable_parallel_execution: bool = True,
         parallel_config: ParallelExecutionConfig | None = None,
+        cancellation_token: CancellationToken | None = None,
     ):
         """
         Initialize the executor.
@@ -121,11 +123,15 @@ class GraphExecutor:
             cleansing_config: Optional output cleansing configuration
             enable_parallel_execution: Enable parallel fan-out execution (default True)
             parallel_config: Configuration for parallel execution behavior
+            cancellation_token: Optional cooperative cancellation signal,
+                threaded through to provider calls so terminated executions
+                can stop blocking work early
         """
         self.runtime = runtime
         self.llm = llm
         self.tools = tools or []
         self.tool_executor = tool_executor
+        self.cancellation_token = cancellation_token
         self.node_registry = node_registry or {}
         self.approval_callback = approval_callback
         self.validator = OutputValidator()
@@ -589,6 +595,7 @@ class GraphExecutor:
             goal_context=goal.to_prompt_context(),
             goal=goal,  # Pass Goal object for LLM-powered routers
             max_tokens=max_tokens,
+            cancellation_token=self.cancellation_token,
         )
 
     # Valid node types - no ambiguous "llm" type allowed
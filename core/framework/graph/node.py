@@ -24,7 +24,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
-from framework.llm.provider import LLMProvider, Tool
+from framework.llm.provider import AsyncLLMAdapter, LLMProvider, Tool
+from framework.runtime.cancellation import CancellationToken
 from framework.runtime.core import Runtime
 
 logger = logging.getLogger(__name__)
@@ -457,6 +458,9 @@ class NodeContext:
     attempt: int = 1
     max_attempts: int = 3
 
+    # Cooperative cancellation (set when guardrails are active)
+    cancellation_token: CancellationToken | None = None
+
 
 @dataclass
 class NodeResult:
@@ -676,6 +680,12 @@ Keep the same JSON structure but with shorter content values.
         if ctx.llm is None:
             return NodeResult(success=False, error="LLM not available")
 
+        # Run blocking provider calls in a worker thread so the event loop
+        # stays responsive (guard timers, event bus) during LLM requests;
+        # providers that accept a cancellation token can stop early when
+        # the guard terminates the execution
+        llm = AsyncLLMAdapter.wrap(ctx.llm, cancellation_token=ctx.cancellation_token)
+
         # Fail fast if tools are required but not available
         if self.require_tools and not ctx.available_tools:
             return NodeResult(
@@ -741,7 +751,7 @@ Keep the same JSON structure but with shorter content values.
                     logger.info(f"         ✓ Tool result: {result_str}")
                     return result
 
-                response = ctx.llm.complete_with_tools(
+                response = await llm.complete_with_tools(
                     messages=messages,
                     system=system,
                     tools=ctx.available_tools,
@@ -761,7 +771,7 @@ Keep the same JSON structure but with shorter content values.
                         f"         📋 Expecting JSON output with keys: {ctx.node_spec.output_keys}"
                     )
 
-                response = ctx.llm.complete(
+                response = await llm.complete(
                     messages=messages,
                     system=system,
                     json_mode=use_json_mode,
@@ -795,7 +805,7 @@ Keep the same JSON structure but with shorter content values.
 
                 # Retry the call with compaction instruction
                 if ctx.available_tools and self.tool_executor:
-                    response = ctx.llm.complete_with_tools(
+                    response = await llm.complete_with_tools(
                         messages=compaction_messages,
                         system=system,
                         tools=ctx.available_tools,
@@ -803,7 +813,7 @@ Keep the same JSON structure but with shorter content values.
                         max_tokens=ctx.max_tokens,
                     )
                 else:
-                    response = ctx.llm.complete(
+                    response = await llm.complete(
                         messages=compaction_messages,
                         system=system,
                         json_mode=use_json_mode,
@@ -884,7 +894,7 @@ Keep the same JSON structure but with shorter content values.
 
                                 # Re-call LLM with feedback
                                 if ctx.available_tools and self.tool_executor:
-                                    response = ctx.llm.complete_with_tools(
+                                    response = await llm.complete_with_tools(
                                         messages=current_messages,
                                         system=system,
                                         tools=ctx.available_tools,
@@ -892,7 +902,7 @@ Keep the same JSON structure but with shorter content values.
                                         max_tokens=ctx.max_tokens,
                                     )
                                 else:
-                                    response = ctx.llm.complete(
+                                    response = await llm.complete(
                                         messages=current_messages,
                                         system=system,
                                         json_mode=use_json_mode,
@@ -1,9 +1,14 @@
 """LLM Provider abstraction for pluggable LLM backends."""
 
+import asyncio
+import inspect
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from framework.runtime.cancellation import CancellationToken
 
 
 @dataclass
@@ -65,6 +70,7 @@ class LLMProvider(ABC):
         max_tokens: int = 1024,
         response_format: dict[str, Any] | None = None,
         json_mode: bool = False,
+        cancellation_token: "CancellationToken | None" = None,
     ) -> LLMResponse:
         """
         Generate a completion from the LLM.
@@ -79,6 +85,9 @@ class LLMProvider(ABC):
                 - {"type": "json_schema", "json_schema": {"name": "...", "schema": {...}}}
                   for strict JSON schema enforcement
             json_mode: If True, request structured JSON output from the LLM
+            cancellation_token: Optional cooperative cancellation signal;
+                implementations that block should check it (or wait on it)
+                so a terminated execution can stop the call early
 
         Returns:
             LLMResponse with content and metadata
@@ -93,6 +102,7 @@ class LLMProvider(ABC):
         tools: list[Tool],
         tool_executor: Callable[["ToolUse"], "ToolResult"],
         max_iterations: int = 10,
+        cancellation_token: "CancellationToken | None" = None,
     ) -> LLMResponse:
         """
         Run a tool-use loop until the LLM produces a final response.
@@ -103,8 +113,72 @@ class LLMProvider(ABC):
             tools: Available tools
             tool_executor: Function to execute tools: (ToolUse) -> ToolResult
             max_iterations: Max tool calls before stopping
+            cancellation_token: Optional cooperative cancellation signal,
+                checked between tool-loop iterations by implementations
 
         Returns:
             Final LLMResponse after tool use completes
         """
         pass
+
+
+class AsyncLLMAdapter:
+    """
+    Async wrapper that runs a synchronous LLMProvider in a worker thread.
+
+    LLMProvider implementations are synchronous; awaiting them directly from
+    a coroutine blocks the event loop for the full duration of the request,
+    which starves timers (e.g. ExecutionGuard deadlines) and other tasks.
+    The adapter offloads each call via asyncio.to_thread so the loop stays
+    responsive while the provider works.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        cancellation_token: "CancellationToken | None" = None,
+    ):
+        self._sync = provider
+        self.cancellation_token = cancellation_token
+        # Providers written before cooperative cancellation may not accept
+        # the kwarg; detect once so calls only forward it when supported
+        self._complete_accepts_token = self._accepts_token(provider.complete)
+        self._tools_accepts_token = self._accepts_token(provider.complete_with_tools)
+
+    @staticmethod
+    def _accepts_token(method: Callable) -> bool:
+        """Check whether a provider method accepts cancellation_token."""
+        try:
+            return "cancellation_token" in inspect.signature(method).parameters
+        except (TypeError, ValueError):
+            return False
+
+    @classmethod
+    def wrap(
+        cls,
+        provider: "LLMProvider | AsyncLLMAdapter",
+        cancellation_token: "CancellationToken | None" = None,
+    ) -> "AsyncLLMAdapter":
+        """Wrap a provider, passing through instances that are already wrapped."""
+        if isinstance(provider, cls):
+            if cancellation_token is not None:
+                provider.cancellation_token = cancellation_token
+            return provider
+        return cls(provider, cancellation_token=cancellation_token)
+
+    @property
+    def provider(self) -> LLMProvider:
+        """The underlying synchronous provider."""
+        return self._sync
+
+    async def complete(self, *args: Any, **kwargs: Any) -> LLMResponse:
+        """Run the provider's complete() in a worker thread."""
+        if self.cancellation_token is not None and self._complete_accepts_token:
+            kwargs.setdefault("cancellation_token", self.cancellation_token)
+        return await asyncio.to_thread(self._sync.complete, *args, **kwargs)
+
+    async def complete_with_tools(self, *args: Any, **kwargs: Any) -> LLMResponse:
+        """Run the provider's complete_with_tools() in a worker thread."""
+        if self.cancellation_token is not None and self._tools_accepts_token:
+            kwargs.setdefault("cancellation_token", self.cancellation_token)
+        return await asyncio.to_thread(self._sync.complete_with_tools, *args, **kwargs)
@@ -1,7 +1,8 @@
 """Runtime core for agent execution."""
 
 from framework.runtime.core import Runtime
+from .cancellation import CancellationToken
 from .execution_guard import ExecutionGuard, ExecutionLimitConfig
 
 
-__all__ = ["Runtime", "ExecutionGuard", "ExecutionLimitConfig"]
+__all__ = ["Runtime", "CancellationToken", "ExecutionGuard", "ExecutionLimitConfig"]
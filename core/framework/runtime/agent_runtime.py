@@ -104,6 +104,7 @@ class AgentRuntime:
         tools: list["Tool"] | None = None,
         tool_executor: Callable | None = None,
         config: AgentRuntimeConfig | None = None,
+        storage: ConcurrentStorage | None = None,
     ):
         """
         Initialize agent runtime.
@@ -116,13 +117,16 @@ class AgentRuntime:
             tools: Available tools
             tool_executor: Function to execute tools
             config: Optional runtime configuration
+            storage: Optional storage instance to use instead of building
+                one from storage_path; pass get_shared_storage() so repeat
+                runtimes over the same store reuse its read cache
         """
         self.graph = graph
         self.goal = goal
         self._config = config or AgentRuntimeConfig()
 
         # Initialize storage
-        self._storage = ConcurrentStorage(
+        self._storage = storage or ConcurrentStorage(
             base_path=storage_path,
             cache_ttl=self._config.cache_ttl,
             batch_interval=self._config.batch_interval,
@@ -236,6 +240,9 @@ class AgentRuntime:
 
             self._streams.clear()
 
+            # Let in-flight background event handlers finish
+            await self._event_bus.drain()
+
             # Stop storage
             await self._storage.stop()
 
@@ -293,7 +300,8 @@ class AgentRuntime:
             session_state: Optional session state to resume from (with paused_at, memory)
 
         Returns:
-            ExecutionResult or None if timeout
+            ExecutionResult, or None if the wait timed out or the guard
+            terminated the execution
         """
         exec_id = await self.trigger(entry_point_id, input_data, session_state=session_state)
         stream = self._streams.get(entry_point_id)
@@ -356,21 +364,33 @@ class AgentRuntime:
 
     def subscribe_to_events(
         self,
-        event_types: list,
-        handler: Callable,
+        event_types: list | None = None,
+        handler: Callable | None = None,
         filter_stream: str | None = None,
+        handlers: dict | None = None,
     ) -> str:
         """
         Subscribe to agent events.
 
+        Pass either event_types + handler (one handler for all types), or
+        handlers (a mapping of event type to handler, dispatched per type).
+
         Args:
             event_types: Types of events to receive
             handler: Async function to call when event occurs
             filter_stream: Only receive events from this stream
+            handlers: Mapping of event type to async handler
 
         Returns:
             Subscription ID (use to unsubscribe)
         """
+        if handlers is not None:
+            return self._event_bus.subscribe_handlers(
+                handlers=handlers,
+                filter_stream=filter_stream,
+            )
+        if event_types is None or handler is None:
+            raise ValueError("Provide either handlers or event_types and handler")
         return self._event_bus.subscribe(
             event_types=event_types,
             handler=handler,
@@ -434,6 +454,7 @@ def create_agent_runtime(
     tools: list["Tool"] | None = None,
     tool_executor: Callable | None = None,
     config: AgentRuntimeConfig | None = None,
+    storage: ConcurrentStorage | None = None,
 ) -> AgentRuntime:
     """
     Create and configure an AgentRuntime with entry points.
@@ -449,6 +470,7 @@ def create_agent_runtime(
         tools: Available tools
         tool_executor: Tool executor function
         config: Runtime configuration
+        storage: Optional storage instance (e.g. from get_shared_storage)
 
     Returns:
         Configured AgentRuntime (not yet started)
@@ -461,6 +483,7 @@ def create_agent_runtime(
         tools=tools,
         tool_executor=tool_executor,
         config=config,
+        storage=storage,
     )
 
     for spec in entry_points:
@@ -0,0 +1,60 @@
+"""
+Cancellation Token - Cooperative cancellation for blocking work.
+
+Asyncio task cancellation only reaches code running on the event loop.
+Blocking provider calls offloaded to worker threads keep running after
+their owning task is cancelled, so a terminated execution can still hold
+a thread for the full duration of the call. A CancellationToken gives
+that code a thread-safe signal it can poll (or wait on) to exit early,
+mirroring the CancellationTokenSource/CancelAfter pattern.
+"""
+
+import threading
+
+
+class CancellationToken:
+    """
+    Thread-safe cooperative cancellation signal.
+
+    The holder calls cancel() when work should stop; cooperative code
+    checks cancelled between units of work, or uses wait() instead of
+    time.sleep() so a pending sleep is interrupted the moment the token
+    is cancelled.
+
+    Example:
+        token = CancellationToken()
+
+        # In a worker thread
+        if token.wait(3):  # Interruptible sleep
+            raise RuntimeError("cancelled")
+
+        # In the guard / controller
+        token.cancel()
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Signal that the associated work should stop."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation has been requested."""
+        return self._event.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Block until cancelled or the timeout elapses.
+
+        A cancellation-aware replacement for time.sleep(): returns as soon
+        as the token is cancelled instead of sleeping out the full timeout.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None = forever)
+
+        Returns:
+            True if the token was cancelled, False if the timeout elapsed
+        """
+        return self._event.wait(timeout)
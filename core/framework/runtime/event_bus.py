@@ -8,6 +8,7 @@ Allows streams to:
 """
 
 import asyncio
+import json
 import logging
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
@@ -56,6 +57,11 @@ class AgentEvent:
     data: dict[str, Any] = field(default_factory=dict)
     timestamp: datetime = field(default_factory=datetime.now)
     correlation_id: str | None = None  # For tracking related events
+    # Monotonic publish order, assigned by the bus. Lifecycle events may be
+    # published concurrently (asyncio.gather), so consumers that care about
+    # order should sort on this rather than arrival or timestamp.
+    sequence: int = field(default=0, init=False, compare=False)
+    _json_cache: bytes | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -66,8 +72,20 @@ class AgentEvent:
             "data": self.data,
             "timestamp": self.timestamp.isoformat(),
             "correlation_id": self.correlation_id,
+            "sequence": self.sequence,
         }
 
+    @property
+    def json_bytes(self) -> bytes:
+        """Serialized event payload, computed once and shared.
+
+        Events fan out to every matching subscriber; memoizing the JSON
+        means N subscribers pay for one serialization instead of N.
+        """
+        if self._json_cache is None:
+            self._json_cache = json.dumps(self.to_dict(), default=str).encode()
+        return self._json_cache
+
 
 # Type for event handlers
 EventHandler = Callable[[AgentEvent], Awaitable[None]]
@@ -82,6 +100,7 @@ class Subscription:
     handler: EventHandler
     filter_stream: str | None = None  # Only receive events from this stream
     filter_execution: str | None = None  # Only receive events from this execution
+    ordered: bool = True  # Await handler during publish; False = background task
 
 
 class EventBus:
@@ -128,11 +147,17 @@ class EventBus:
             max_concurrent_handlers: Maximum concurrent handler executions
         """
         self._subscriptions: dict[str, Subscription] = {}
+        # Per-type index so publish() is a dict lookup instead of scanning
+        # every subscription and comparing event types
+        self._by_type: dict[EventType, list[Subscription]] = {}
         self._event_history: list[AgentEvent] = []
         self._max_history = max_history
         self._semaphore = asyncio.Semaphore(max_concurrent_handlers)
         self._subscription_counter = 0
+        self._sequence = 0
         self._lock = asyncio.Lock()
+        # Background handler tasks for ordered=False subscriptions
+        self._pending: set[asyncio.Task] = set()
 
     def subscribe(
         self,
@@ -140,6 +165,7 @@ class EventBus:
         handler: EventHandler,
         filter_stream: str | None = None,
         filter_execution: str | None = None,
+        ordered: bool = True,
     ) -> str:
         """
         Subscribe to events.
@@ -149,6 +175,9 @@ class EventBus:
             handler: Async function to call when event occurs
             filter_stream: Only receive events from this stream
             filter_execution: Only receive events from this execution
+            ordered: If True (default), publish() awaits this handler; if
+                False, the handler runs as a background task so a slow
+                subscriber cannot stall event dispatch
 
         Returns:
             Subscription ID (use to unsubscribe)
@@ -162,13 +191,51 @@ class EventBus:
             handler=handler,
             filter_stream=filter_stream,
             filter_execution=filter_execution,
+            ordered=ordered,
         )
 
         self._subscriptions[sub_id] = subscription
+        for event_type in subscription.event_types:
+            self._by_type.setdefault(event_type, []).append(subscription)
         logger.debug(f"Subscription {sub_id} registered for {event_types}")
 
         return sub_id
 
+    def subscribe_handlers(
+        self,
+        handlers: dict[EventType, EventHandler],
+        filter_stream: str | None = None,
+        filter_execution: str | None = None,
+        ordered: bool = True,
+    ) -> str:
+        """
+        Subscribe a per-type handler table.
+
+        Convenience over subscribe() for callers that would otherwise branch
+        on event.type inside a single handler: each event type dispatches
+        directly to its own handler.
+
+        Args:
+            handlers: Mapping of event type to async handler
+            filter_stream: Only receive events from this stream
+            filter_execution: Only receive events from this execution
+
+        Returns:
+            Subscription ID (use to unsubscribe)
+        """
+        table = dict(handlers)
+
+        async def dispatch(event: AgentEvent) -> None:
+            await table[event.type](event)
+
+        return self.subscribe(
+            event_types=list(table),
+            handler=dispatch,
+            filter_stream=filter_stream,
+            filter_execution=filter_execution,
+            ordered=ordered,
+        )
+
     def unsubscribe(self, subscription_id: str) -> bool:
         """
         Unsubscribe from events.
@@ -179,8 +246,14 @@ class EventBus:
         Returns:
             True if subscription was found and removed
         """
-        if subscription_id in self._subscriptions:
-            del self._subscriptions[subscription_id]
+        subscription = self._subscriptions.pop(subscription_id, None)
+        if subscription is not None:
+            for event_type in subscription.event_types:
+                subscribers = self._by_type.get(event_type)
+                if subscribers is not None:
+                    subscribers.remove(subscription)
+                    if not subscribers:
+                        del self._by_type[event_type]
             logger.debug(f"Subscription {subscription_id} removed")
             return True
         return False
@@ -192,29 +265,54 @@ class EventBus:
         Args:
             event: Event to publish
         """
-        # Add to history
+        # Stamp publish order and add to history; the lock keeps sequence
+        # numbers unique when publishes run concurrently via gather
         async with self._lock:
+            self._sequence += 1
+            event.sequence = self._sequence
             self._event_history.append(event)
             if len(self._event_history) > self._max_history:
                 self._event_history = self._event_history[-self._max_history :]
 
-        # Find matching subscriptions
+        # Only subscriptions indexed under this event type can match
         matching_handlers: list[EventHandler] = []
 
-        for subscription in self._subscriptions.values():
+        for subscription in self._by_type.get(event.type, ()):
             if self._matches(subscription, event):
-                matching_handlers.append(subscription.handler)
+                if subscription.ordered:
+                    matching_handlers.append(subscription.handler)
+                else:
+                    # Decouple dispatch latency from handler work
+                    self._spawn_handler(event, subscription.handler)
 
-        # Execute handlers concurrently
+        # Execute ordered handlers concurrently
         if matching_handlers:
             await self._execute_handlers(event, matching_handlers)
 
+    def _spawn_handler(self, event: AgentEvent, handler: EventHandler) -> None:
+        """Run a handler as a background task, tracked for drain()."""
+
+        async def run_handler() -> None:
+            async with self._semaphore:
+                try:
+                    await handler(event)
+                except Exception as e:
+                    logger.error(f"Handler error for {event.type}: {e}")
+
+        task = asyncio.create_task(run_handler())
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def drain(self) -> None:
+        """Wait for all background handler tasks to finish (for shutdown)."""
+        while self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+
     def _matches(self, subscription: Subscription, event: AgentEvent) -> bool:
-        """Check if a subscription matches an event."""
-        # Check event type
-        if event.type not in subscription.event_types:
-            return False
+        """Check if a subscription's filters match an event.
 
+        The event type is already matched by the _by_type index.
+        """
         # Check stream filter
         if subscription.filter_stream and subscription.filter_stream != event.stream_id:
             return False
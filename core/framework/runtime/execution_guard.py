@@ -11,10 +11,18 @@ deterministic termination with structured reasons for observability.
 """
 
 import asyncio
+import heapq
 import logging
+import math
+import sys
 import time
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Optional
+from weakref import WeakKeyDictionary
+
+from framework.runtime.cancellation import CancellationToken
 
 logger = logging.getLogger(__name__)
 
@@ -28,12 +36,28 @@ class ExecutionLimitConfig:
     max_cost_usd: Optional[float] = None  # Maximum cost in USD, None = no limit
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExecutionGuardResult:
-    """Result of execution guard check."""
+    """Result of execution guard check.
+
+    Slotted and frozen: results are created on every terminating check and
+    never mutated, so skipping the per-instance __dict__ keeps them cheap.
+    """
     should_terminate: bool
     reason: str
-    details: dict[str, object]
+    details: Mapping[str, object]
+
+
+# Shared result for the common "nothing tripped" path; avoids allocating a
+# new result (and details dict) on every per-step check. Detailed usage
+# numbers are available via ExecutionGuard.get_stats(). The details proxy
+# is read-only: a plain dict on a shared instance would let one caller's
+# mutation leak into every subsequent check.
+_OK_RESULT = ExecutionGuardResult(
+    should_terminate=False,
+    reason="WITHIN_LIMITS",
+    details=MappingProxyType({}),
+)
 
 
 class ExecutionGuard:
@@ -44,26 +68,71 @@ class ExecutionGuard:
     deterministic termination conditions to prevent runaway behavior.
     """
     
-    def __init__(self, execution_id: str, config: ExecutionLimitConfig):
+    def __init__(
+        self,
+        execution_id: str,
+        config: ExecutionLimitConfig,
+        cancellation_token: Optional[CancellationToken] = None,
+    ):
         """
         Initialize the execution guard.
-        
+
         Args:
             execution_id: Unique identifier for this execution
             config: Execution limit configuration
+            cancellation_token: Optional token cancelled when a limit trips,
+                so cooperative blocking work (e.g. provider calls in worker
+                threads) can exit early; one is created if not provided
         """
         self.execution_id = execution_id
         self.config = config
-        self.start_time = time.time()
+        self.cancellation_token = cancellation_token or CancellationToken()
         self.step_count = 0
         self.token_count = 0
         self.cost_tracker = 0.0
-        
-        logger.debug(f"ExecutionGuard initialized for {execution_id} with limits: {config}")
-    
+
+        # Precompute the absolute deadline so runtime checks are a single
+        # comparison instead of re-reading the clock config on every call.
+        # monotonic_ns is immune to wall-clock jumps and avoids float
+        # conversion until a result actually needs milliseconds.
+        self._start_ns = time.monotonic_ns()
+        self._deadline_ns: Optional[int] = (
+            self._start_ns + config.max_runtime_ms * 1_000_000
+            if config.max_runtime_ms is not None
+            else None
+        )
+        # Replace None sentinels with "infinite" limits once, so the hot
+        # path in check_all_limits is a plain comparison per limit. The
+        # step trigger folds the "fires after exceeding max_steps" +1 in,
+        # so the check is a single >= with no None test or off-by-one.
+        self._step_limit_trigger = (
+            config.max_steps + 1 if config.max_steps is not None else sys.maxsize
+        )
+        self._max_tokens = config.max_tokens if config.max_tokens is not None else sys.maxsize
+        self._max_cost = config.max_cost_usd if config.max_cost_usd is not None else math.inf
+        self._deadline = self._deadline_ns if self._deadline_ns is not None else sys.maxsize
+
+        # Staged token/cost increments: streamed deltas accumulate locally
+        # and fold into the tracked totals at flush points (limit checks,
+        # step boundaries, stats) or once the stage grows past ~1% of the
+        # limit, so we never overshoot a limit by more than that.
+        self._pending_tokens = 0
+        self._pending_cost = 0.0
+        self._token_flush_threshold = (
+            max(1, config.max_tokens // 100) if config.max_tokens is not None else sys.maxsize
+        )
+        self._cost_flush_threshold = (
+            config.max_cost_usd / 100 if config.max_cost_usd is not None else math.inf
+        )
+
+        # Lazy %-formatting: the args are only rendered if a handler
+        # actually accepts DEBUG records
+        logger.debug("ExecutionGuard initialized for %s with limits: %s", execution_id, config)
+
     def check_step_limit(self) -> Optional[ExecutionGuardResult]:
         """Check if step limit has been exceeded (terminate after exceeding max_steps)."""
-        if self.config.max_steps is not None and self.step_count > self.config.max_steps:
+        if self.step_count >= self._step_limit_trigger:
+            self.cancellation_token.cancel()
             return ExecutionGuardResult(
                 should_terminate=True,
                 reason="STEP_LIMIT_EXCEEDED",
@@ -74,24 +143,43 @@ class ExecutionGuard:
             )
         return None
     
-    def check_runtime_limit(self) -> Optional[ExecutionGuardResult]:
-        """Check if runtime limit has been exceeded."""
-        if self.config.max_runtime_ms is not None:
-            current_runtime_ms = (time.time() - self.start_time) * 1000
-            if current_runtime_ms >= self.config.max_runtime_ms:
-                return ExecutionGuardResult(
-                    should_terminate=True,
-                    reason="TIME_LIMIT_EXCEEDED",
-                    details={
-                        "current_runtime_ms": current_runtime_ms,
-                        "max_runtime_ms": self.config.max_runtime_ms,
-                    }
-                )
+    def check_runtime_limit(self, now_ns: Optional[int] = None) -> Optional[ExecutionGuardResult]:
+        """Check if runtime limit has been exceeded.
+
+        Args:
+            now_ns: Optional pre-read monotonic_ns timestamp, so callers
+                checking several limits only read the clock once
+        """
+        if self._deadline_ns is None:
+            return None
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        if now_ns >= self._deadline_ns:
+            self.cancellation_token.cancel()
+            return ExecutionGuardResult(
+                should_terminate=True,
+                reason="TIME_LIMIT_EXCEEDED",
+                details={
+                    "current_runtime_ms": (now_ns - self._start_ns) / 1e6,
+                    "max_runtime_ms": self.config.max_runtime_ms,
+                }
+            )
         return None
     
+    def _flush_pending(self) -> None:
+        """Fold staged token/cost increments into the tracked totals."""
+        if self._pending_tokens:
+            self.token_count += self._pending_tokens
+            self._pending_tokens = 0
+        if self._pending_cost:
+            self.cost_tracker += self._pending_cost
+            self._pending_cost = 0.0
+
     def check_token_limit(self) -> Optional[ExecutionGuardResult]:
         """Check if token limit has been exceeded."""
+        self._flush_pending()
         if self.config.max_tokens is not None and self.token_count >= self.config.max_tokens:
+            self.cancellation_token.cancel()
             return ExecutionGuardResult(
                 should_terminate=True,
                 reason="TOKEN_LIMIT_EXCEEDED",
@@ -104,7 +192,9 @@ class ExecutionGuard:
     
     def check_cost_limit(self) -> Optional[ExecutionGuardResult]:
         """Check if cost limit has been exceeded."""
+        self._flush_pending()
         if self.config.max_cost_usd is not None and self.cost_tracker >= self.config.max_cost_usd:
+            self.cancellation_token.cancel()
             return ExecutionGuardResult(
                 should_terminate=True,
                 reason="COST_LIMIT_EXCEEDED",
@@ -118,58 +208,70 @@ class ExecutionGuard:
     def check_all_limits(self) -> ExecutionGuardResult:
         """
         Check all configured limits and return termination result.
-        
+
         Returns:
             ExecutionGuardResult indicating if execution should terminate
         """
-        # Check each limit in order of criticality
-        checks = [
-            self.check_step_limit(),
-            self.check_runtime_limit(),
-            self.check_token_limit(),
-            self.check_cost_limit(),
-        ]
-        
-        for check_result in checks:
-            if check_result is not None:
-                logger.warning(
-                    f"ExecutionGuard: Terminating execution {self.execution_id} "
-                    f"due to {check_result.reason}: {check_result.details}"
-                )
-                return check_result
-        
+        # Short-circuit comparisons against precomputed limits, in order of
+        # criticality; the detailed result is only constructed when a limit
+        # actually trips.
+        self._flush_pending()
+        now_ns = time.monotonic_ns()
+        check_result: Optional[ExecutionGuardResult] = None
+        if self.step_count >= self._step_limit_trigger:
+            check_result = self.check_step_limit()
+        elif now_ns >= self._deadline:
+            check_result = self.check_runtime_limit(now_ns)
+        elif self.token_count >= self._max_tokens:
+            check_result = self.check_token_limit()
+        elif self.cost_tracker >= self._max_cost:
+            check_result = self.check_cost_limit()
+
+        if check_result is not None:
+            logger.warning(
+                "ExecutionGuard: Terminating execution %s due to %s: %s",
+                self.execution_id,
+                check_result.reason,
+                check_result.details,
+            )
+            return check_result
+
         # All checks passed
-        return ExecutionGuardResult(
-            should_terminate=False,
-            reason="WITHIN_LIMITS",
-            details={
-                "step_count": self.step_count,
-                "runtime_ms": (time.time() - self.start_time) * 1000,
-                "token_count": self.token_count,
-                "cost_usd": self.cost_tracker,
-            }
-        )
+        return _OK_RESULT
     
     def increment_step(self) -> None:
-        """Increment step counter."""
+        """Increment step counter (a step boundary also flushes staged usage)."""
         self.step_count += 1
-    
+        self._flush_pending()
+
     def add_tokens(self, token_count: int) -> None:
-        """Add tokens to the counter."""
-        if token_count > 0:
-            self.token_count += token_count
-    
+        """Add tokens to the counter (negative deltas are ignored)."""
+        # Ternary instead of a guard branch: the add always runs, so the
+        # common streaming path (positive deltas at high frequency) never
+        # takes a mispredicted jump
+        self._pending_tokens += token_count if token_count > 0 else 0
+        if self._pending_tokens >= self._token_flush_threshold:
+            self._flush_pending()
+
     def add_cost(self, cost_usd: float) -> None:
-        """Add cost to the tracker."""
-        if cost_usd > 0:
-            self.cost_tracker += cost_usd
-    
-    def get_stats(self) -> dict[str, object]:
-        """Get current execution statistics."""
+        """Add cost to the tracker (negative deltas are ignored)."""
+        self._pending_cost += cost_usd if cost_usd > 0 else 0.0
+        if self._pending_cost >= self._cost_flush_threshold:
+            self._flush_pending()
+
+    def get_stats(self, now_ns: Optional[int] = None) -> dict[str, object]:
+        """Get current execution statistics.
+
+        Args:
+            now_ns: Optional pre-read monotonic_ns timestamp to reuse
+        """
+        self._flush_pending()
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
         return {
             "execution_id": self.execution_id,
             "step_count": self.step_count,
-            "runtime_ms": (time.time() - self.start_time) * 1000,
+            "runtime_ms": (now_ns - self._start_ns) / 1e6,
             "token_count": self.token_count,
             "cost_usd": self.cost_tracker,
             "limits": {
@@ -178,4 +280,91 @@ class ExecutionGuard:
                 "max_tokens": self.config.max_tokens,
                 "max_cost_usd": self.config.max_cost_usd,
             }
-        }
\ No newline at end of file
+        }
+
+
+class GuardScheduler:
+    """
+    Shared deadline scheduler for active execution guards.
+
+    Arming one asyncio timer per execution means O(N) timers under load.
+    The scheduler keeps a single heap of (deadline, guard, callback)
+    entries and one worker coroutine that sleeps until the nearest
+    deadline, so N concurrent executions cost one sleeping task plus
+    O(log N) per register/fire. Only time limits go through the
+    scheduler; step/token/cost checks stay inline in check_all_limits
+    because they are cheap comparisons.
+
+    Use get_guard_scheduler() to obtain the instance for the running
+    event loop.
+    """
+
+    def __init__(self):
+        # Heap entries: [deadline_ns, seq, guard, on_timeout]; on_timeout
+        # is set to None on unregister (lazy deletion) and skipped on pop
+        self._heap: list[list] = []
+        self._entries: dict[ExecutionGuard, list] = {}
+        self._seq = 0
+        self._wakeup = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+
+    def register(self, guard: ExecutionGuard, on_timeout: Callable[[], None]) -> None:
+        """
+        Schedule on_timeout to fire when the guard's runtime deadline passes.
+
+        No-op when the guard has no runtime limit configured.
+        """
+        if guard._deadline_ns is None:
+            return
+        self._seq += 1
+        entry = [guard._deadline_ns, self._seq, guard, on_timeout]
+        heapq.heappush(self._heap, entry)
+        self._entries[guard] = entry
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        else:
+            # Wake the worker in case this deadline is now the nearest
+            self._wakeup.set()
+
+    def unregister(self, guard: ExecutionGuard) -> None:
+        """Drop a guard's pending deadline (call on normal completion)."""
+        entry = self._entries.pop(guard, None)
+        if entry is not None:
+            entry[3] = None
+
+    async def _run(self) -> None:
+        """Worker loop: sleep until the nearest deadline, then fire it."""
+        while self._heap:
+            deadline_ns, _, _, on_timeout = self._heap[0]
+            if on_timeout is None:
+                heapq.heappop(self._heap)
+                continue
+            delay = (deadline_ns - time.monotonic_ns()) / 1e9
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    # An earlier deadline may be registered while we sleep;
+                    # the wakeup event makes us re-evaluate the heap top
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    continue
+                except TimeoutError:
+                    pass
+            entry = heapq.heappop(self._heap)
+            if entry[3] is not None:
+                self._entries.pop(entry[2], None)
+                entry[3]()
+
+
+# One scheduler per event loop: executions in the same loop share a heap,
+# and loops in tests/demos don't see each other's stale worker tasks
+_schedulers: "WeakKeyDictionary[asyncio.AbstractEventLoop, GuardScheduler]" = WeakKeyDictionary()
+
+
+def get_guard_scheduler() -> GuardScheduler:
+    """Get the GuardScheduler for the running event loop."""
+    loop = asyncio.get_running_loop()
+    scheduler = _schedulers.get(loop)
+    if scheduler is None:
+        scheduler = GuardScheduler()
+        _schedulers[loop] = scheduler
+    return scheduler
\ No newline at end of file
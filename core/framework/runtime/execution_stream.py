@@ -20,7 +20,11 @@ from typing import TYPE_CHECKING, Any, Optional
 from framework.graph.executor import ExecutionResult, GraphExecutor
 from framework.runtime.shared_state import IsolationLevel, SharedStateManager, StateScope
 from framework.runtime.stream_runtime import StreamRuntime, StreamRuntimeAdapter
-from framework.runtime.execution_guard import ExecutionGuard, ExecutionLimitConfig
+from framework.runtime.execution_guard import (
+    ExecutionGuard,
+    ExecutionLimitConfig,
+    get_guard_scheduler,
+)
 
 if TYPE_CHECKING:
     from framework.graph.edge import GraphSpec
@@ -66,7 +70,7 @@ class ExecutionContext:
     session_state: dict[str, Any] | None = None  # For resuming from pause
     started_at: datetime = field(default_factory=datetime.now)
     completed_at: datetime | None = None
-    status: str = "pending"  # pending, running, completed, failed, paused
+    status: str = "pending"  # pending, running, completed, failed, paused, terminated
     termination_reason: str | None = None  # Set when guardrail limit exceeded
     termination_details: dict[str, Any] | None = None
 
@@ -301,19 +305,35 @@ class ExecutionStream:
         async with self._semaphore:
             ctx.status = "running"
 
-            # Initialize execution guard if guardrails are enabled
+            # Initialize execution guard if guardrails are enabled. The
+            # guard-stats write and the started event are independent, so
+            # they are gathered to overlap rather than awaited in series.
             guard: Optional[ExecutionGuard] = None
+            setup_publishes = []
             if self.guard_config is not None:
                 guard = ExecutionGuard(execution_id, self.guard_config)
                 # Record guard start in shared state
-                await self._state_manager.write(
-                    "execution_guard_stats",
-                    guard.get_stats(),
-                    execution_id=execution_id,
-                    stream_id=self.stream_id,
-                    isolation=IsolationLevel.SHARED,
-                    scope=StateScope.EXECUTION,
+                setup_publishes.append(
+                    self._state_manager.write(
+                        "execution_guard_stats",
+                        guard.get_stats(),
+                        execution_id=execution_id,
+                        stream_id=self.stream_id,
+                        isolation=IsolationLevel.SHARED,
+                        scope=StateScope.EXECUTION,
+                    )
+                )
+            if self._event_bus:
+                setup_publishes.append(
+                    self._event_bus.emit_execution_started(
+                        stream_id=self.stream_id,
+                        execution_id=execution_id,
+                        input_data=ctx.input_data,
+                        correlation_id=ctx.correlation_id,
+                    )
                 )
+            if setup_publishes:
+                await asyncio.gather(*setup_publishes)
 
             try:
                 # Set up runtime adapter
@@ -322,71 +342,113 @@ class ExecutionStream:
                     execution_id=execution_id,
                 )
 
-                # Create executor for this execution
+                # Create executor for this execution; the guard's token lets
+                # cooperative provider calls stop early on termination
                 executor = GraphExecutor(
                     runtime=runtime_adapter,
                     llm=self._llm,
                     tools=self._tools,
                     tool_executor=self._tool_executor,
+                    cancellation_token=guard.cancellation_token if guard is not None else None,
                 )
 
                 # Create modified graph with entry point
                 modified_graph = self._create_modified_graph()
 
-                # Set up guard checking coroutine
-                async def monitor_execution() -> None:
-                    """Background task to monitor execution limits."""
+                # Run the executor as its own task so the guard timer can
+                # cancel it the moment the runtime deadline passes, rather
+                # than waiting for the next poll interval.
+                exec_task: Optional[asyncio.Task] = None
+
+                async def handle_guard_timeout() -> None:
+                    """Publish termination and cancel the in-flight execution."""
                     if guard is None:
                         return
-                    while True:
-                        await asyncio.sleep(1)  # Check every second
-                        result = guard.check_all_limits()
-                        if result.should_terminate:
-                            # Emit termination event
-                            if self._event_bus:
-                                from framework.runtime.event_bus import AgentEvent, EventType
-
-                                await self._event_bus.publish(
-                                    AgentEvent(
-                                        type=EventType.EXECUTION_TERMINATED,
-                                        stream_id=self.stream_id,
-                                        execution_id=execution_id,
-                                        data={
-                                            "reason": result.reason,
-                                            "details": result.details,
-                                        },
-                                    )
+                    result = guard.check_runtime_limit()
+                    if result is None:
+                        return
+                    # Cancel before publishing so the execution can't slip
+                    # to completion while the event is being dispatched
+                    ctx.termination_reason = result.reason
+                    ctx.termination_details = result.details
+                    if exec_task is not None and not exec_task.done():
+                        exec_task.cancel()
+                    # Final stats write and termination event are
+                    # independent; gather so shutdown latency tracks the
+                    # slowest of the two, not their sum
+                    shutdown_publishes = [
+                        self._state_manager.write(
+                            "execution_guard_stats",
+                            guard.get_stats(),
+                            execution_id=execution_id,
+                            stream_id=self.stream_id,
+                            isolation=IsolationLevel.SHARED,
+                            scope=StateScope.EXECUTION,
+                        )
+                    ]
+                    if self._event_bus:
+                        from framework.runtime.event_bus import AgentEvent, EventType
+
+                        shutdown_publishes.append(
+                            self._event_bus.publish(
+                                AgentEvent(
+                                    type=EventType.EXECUTION_TERMINATED,
+                                    stream_id=self.stream_id,
+                                    execution_id=execution_id,
+                                    data={
+                                        "reason": result.reason,
+                                        "details": result.details,
+                                    },
                                 )
-                            ctx.termination_reason = result.reason
-                            ctx.termination_details = result.details
-                            break
+                            )
+                        )
+                    await asyncio.gather(*shutdown_publishes)
+
+                def on_guard_timeout() -> None:
+                    # call_later callbacks are sync; hand off to a task
+                    asyncio.ensure_future(handle_guard_timeout())
 
-                # Start monitoring if guardrails enabled
-                monitor_task: Optional[asyncio.Task] = None
+                # Register the deadline with the per-loop scheduler: all
+                # active executions share one heap and one sleeping task
                 if guard is not None:
-                    monitor_task = asyncio.create_task(monitor_execution())
+                    get_guard_scheduler().register(guard, on_guard_timeout)
 
                 try:
                     # Execute
-                    result = await executor.execute(
-                        graph=modified_graph,
-                        goal=self.goal,
-                        input_data=ctx.input_data,
-                        session_state=ctx.session_state,
+                    exec_task = asyncio.create_task(
+                        executor.execute(
+                            graph=modified_graph,
+                            goal=self.goal,
+                            input_data=ctx.input_data,
+                            session_state=ctx.session_state,
+                        )
                     )
+                    result = await exec_task
 
                     # Store result with retention
                     self._record_execution_result(execution_id, result)
                     ctx.status = "completed"
                     ctx.completed_at = datetime.now()
+                    if self._event_bus:
+                        await self._event_bus.emit_execution_completed(
+                            stream_id=self.stream_id,
+                            execution_id=execution_id,
+                            output=result.output,
+                            correlation_id=ctx.correlation_id,
+                        )
+                except asyncio.CancelledError:
+                    if ctx.termination_reason is None:
+                        # External cancellation (stop / cancel_execution)
+                        if exec_task is not None and not exec_task.done():
+                            exec_task.cancel()
+                        raise
+                    # Guard-initiated termination: record and exit cleanly
+                    ctx.status = "terminated"
+                    ctx.completed_at = datetime.now()
                 finally:
-                    # Stop monitoring
-                    if monitor_task is not None:
-                        monitor_task.cancel()
-                        try:
-                            await monitor_task
-                        except asyncio.CancelledError:
-                            pass
+                    # Deadline is no longer needed
+                    if guard is not None:
+                        get_guard_scheduler().unregister(guard)
 
             except Exception as e:
                 # Log with guard info if available
@@ -448,7 +510,9 @@ class ExecutionStream:
             timeout: Maximum time to wait (seconds)
 
         Returns:
-            ExecutionResult or None if timeout
+            ExecutionResult, or None if the wait timed out or the guard
+            terminated the execution (check the EXECUTION_TERMINATED
+            event or get_context() to distinguish)
         """
         event = self._completion_events.get(execution_id)
         if event is None:
@@ -36,6 +36,10 @@ class FileStorage:
 
     def _ensure_dirs(self) -> None:
         """Create directory structure if it doesn't exist."""
+        # Fast path: if the last-created directory exists the layout is
+        # already provisioned; one stat instead of five mkdir syscalls
+        if (self.base_path / "summaries").is_dir():
+            return
         dirs = [
             self.base_path / "runs",
             self.base_path / "indexes" / "by_goal",
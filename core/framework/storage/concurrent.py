@@ -12,6 +12,7 @@ import logging
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from weakref import WeakValueDictionary
@@ -100,10 +101,28 @@ class ConcurrentStorage:
         if self._running:
             return
 
+        # asyncio primitives bind to the loop they first run in, and a
+        # shared instance (get_shared_storage) may be restarted from a
+        # different asyncio.run loop, so rebuild them on each start. The
+        # queue is safe to drop: save_run only enqueues while running,
+        # and stop() flushes it before clearing _running.
+        self._write_queue = asyncio.Queue()
+        self._file_locks = WeakValueDictionary()
+        self._lru_tracking = OrderedDict()
+
         self._running = True
         self._batch_task = asyncio.create_task(self._batch_writer())
         logger.info(f"ConcurrentStorage started: {self.base_path}")
 
+    async def ensure_started(self) -> None:
+        """Start the batch writer if it isn't already running.
+
+        Alias for start(), which is idempotent; the name signals intent at
+        call sites that share one instance across runs (see
+        get_shared_storage) and may race on first use.
+        """
+        await self.start()
+
     async def stop(self) -> None:
         """Stop the batch writer and flush pending writes."""
         if not self._running:
@@ -422,3 +441,24 @@ class ConcurrentStorage:
     def load_run_sync(self, run_id: str) -> Run | None:
         """Synchronous load (uses base storage directly)."""
         return self._base_storage.load_run(run_id)
+
+
+@lru_cache(maxsize=None)
+def _shared_storage(base_path: str) -> ConcurrentStorage:
+    return ConcurrentStorage(base_path)
+
+
+def get_shared_storage(base_path: str | Path) -> ConcurrentStorage:
+    """
+    Get the process-wide ConcurrentStorage for a base path.
+
+    Repeated callers get the same instance, so its read cache persists
+    across invocations instead of being rebuilt. Pass the instance to
+    every component that touches the path (e.g. AgentRuntime's storage
+    parameter) — anything that constructs its own ConcurrentStorage
+    bypasses the shared cache. Loop-bound state (write queue, file
+    locks) is rebuilt by start() per event loop; call ensure_started()
+    before use, and skip stop() if other users of the path in the same
+    loop may still be active.
+    """
+    return _shared_storage(str(base_path))
@@ -4,7 +4,12 @@ Tests for ExecutionGuard runtime safety limits.
 
 import asyncio
 import pytest
-from framework.runtime.execution_guard import ExecutionGuard, ExecutionLimitConfig
+from framework.runtime.cancellation import CancellationToken
+from framework.runtime.execution_guard import (
+    ExecutionGuard,
+    ExecutionLimitConfig,
+    get_guard_scheduler,
+)
 
 
 class TestExecutionGuard:
@@ -36,10 +41,10 @@ class TestExecutionGuard:
         # Should not trigger immediately
         result = guard.check_runtime_limit()
         assert result is None
-        
-        # Wait for 150ms
-        import time
-        time.sleep(0.15)
+
+        # Wait for 150ms (interruptible, unlike time.sleep)
+        import threading
+        threading.Event().wait(0.15)
         
         # Should trigger now
         result = guard.check_runtime_limit()
@@ -129,4 +134,109 @@ class TestExecutionGuard:
         assert stats["step_count"] == 1
         assert stats["token_count"] == 25
         assert stats["cost_usd"] == 0.25
-        assert stats["limits"]["max_steps"] == 100
\ No newline at end of file
+        assert stats["limits"]["max_steps"] == 100
+
+
+class TestCancellationToken:
+    """Test cooperative cancellation signalling."""
+
+    def test_initially_not_cancelled(self):
+        """Test that a fresh token reports not cancelled."""
+        token = CancellationToken()
+        assert token.cancelled is False
+
+    def test_cancel_sets_flag_and_unblocks_wait(self):
+        """Test that cancel() flips the flag and releases waiters."""
+        token = CancellationToken()
+        token.cancel()
+        assert token.cancelled is True
+        assert token.wait(timeout=1) is True
+
+    def test_wait_times_out_when_not_cancelled(self):
+        """Test that wait() returns False after the timeout elapses."""
+        token = CancellationToken()
+        assert token.wait(timeout=0.01) is False
+
+    def test_guard_cancels_token_when_limit_trips(self):
+        """Test that a tripped limit cancels the guard's token."""
+        config = ExecutionLimitConfig(max_steps=1)
+        guard = ExecutionGuard("test-execution", config)
+
+        guard.increment_step()
+        assert guard.check_step_limit() is None
+        assert guard.cancellation_token.cancelled is False
+
+        guard.increment_step()
+        assert guard.check_step_limit() is not None
+        assert guard.cancellation_token.cancelled is True
+
+    def test_guard_uses_provided_token(self):
+        """Test that a caller-supplied token is the one cancelled."""
+        token = CancellationToken()
+        config = ExecutionLimitConfig(max_tokens=10)
+        guard = ExecutionGuard("test-execution", config, cancellation_token=token)
+
+        guard.add_tokens(20)
+        assert guard.check_token_limit() is not None
+        assert token.cancelled is True
+
+
+class TestGuardScheduler:
+    """Test the shared deadline scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_deadline_fires_callback(self):
+        """Test that a registered deadline fires its callback."""
+        config = ExecutionLimitConfig(max_runtime_ms=50)
+        guard = ExecutionGuard("test-execution", config)
+
+        fired = asyncio.Event()
+        get_guard_scheduler().register(guard, fired.set)
+
+        await asyncio.wait_for(fired.wait(), timeout=2)
+
+    @pytest.mark.asyncio
+    async def test_guard_without_runtime_limit_is_ignored(self):
+        """Test that registering a guard with no time limit is a no-op."""
+        config = ExecutionLimitConfig(max_steps=3)
+        guard = ExecutionGuard("test-execution", config)
+
+        scheduler = get_guard_scheduler()
+        scheduler.register(guard, lambda: None)
+
+        assert guard not in scheduler._entries
+
+    @pytest.mark.asyncio
+    async def test_unregister_suppresses_fire(self):
+        """Test that an unregistered deadline does not fire."""
+        config = ExecutionLimitConfig(max_runtime_ms=50)
+        guard = ExecutionGuard("test-execution", config)
+
+        fired = asyncio.Event()
+        scheduler = get_guard_scheduler()
+        scheduler.register(guard, fired.set)
+        scheduler.unregister(guard)
+
+        await asyncio.sleep(0.15)
+        assert not fired.is_set()
+
+    @pytest.mark.asyncio
+    async def test_earlier_deadline_registered_during_sleep_fires_first(self):
+        """Test that a nearer deadline wakes the sleeping worker."""
+        scheduler = get_guard_scheduler()
+        fired: list[str] = []
+
+        late = ExecutionGuard("late", ExecutionLimitConfig(max_runtime_ms=400))
+        scheduler.register(late, lambda: fired.append("late"))
+
+        # Let the worker start sleeping on the late deadline, then
+        # register a nearer one
+        await asyncio.sleep(0.05)
+        early = ExecutionGuard("early", ExecutionLimitConfig(max_runtime_ms=50))
+        scheduler.register(early, lambda: fired.append("early"))
+
+        await asyncio.sleep(0.2)
+        assert fired == ["early"]
+
+        await asyncio.sleep(0.4)
+        assert fired == ["early", "late"]
\ No newline at end of file
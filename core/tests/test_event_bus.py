@@ -0,0 +1,179 @@
+"""Tests for EventBus dispatch, subscription index, and background handlers."""
+
+import asyncio
+
+import pytest
+
+from framework.runtime.event_bus import AgentEvent, EventBus, EventType
+
+
+def make_event(
+    event_type: EventType = EventType.EXECUTION_COMPLETED,
+    stream_id: str = "stream-1",
+    execution_id: str = "exec-1",
+) -> AgentEvent:
+    return AgentEvent(
+        type=event_type,
+        stream_id=stream_id,
+        execution_id=execution_id,
+    )
+
+
+class TestSubscriptionIndex:
+    """Test type-indexed dispatch and index consistency."""
+
+    @pytest.mark.asyncio
+    async def test_publish_dispatches_only_matching_type(self):
+        bus = EventBus()
+        received: list[AgentEvent] = []
+
+        async def handler(event: AgentEvent) -> None:
+            received.append(event)
+
+        bus.subscribe(event_types=[EventType.EXECUTION_COMPLETED], handler=handler)
+
+        await bus.publish(make_event(EventType.EXECUTION_COMPLETED))
+        await bus.publish(make_event(EventType.EXECUTION_FAILED))
+
+        assert len(received) == 1
+        assert received[0].type == EventType.EXECUTION_COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_stops_dispatch_and_cleans_index(self):
+        bus = EventBus()
+        received: list[AgentEvent] = []
+
+        async def handler(event: AgentEvent) -> None:
+            received.append(event)
+
+        sub_id = bus.subscribe(
+            event_types=[EventType.EXECUTION_COMPLETED, EventType.EXECUTION_FAILED],
+            handler=handler,
+        )
+
+        assert bus.unsubscribe(sub_id) is True
+        # The index must not hold empty lists for removed subscriptions
+        assert EventType.EXECUTION_COMPLETED not in bus._by_type
+        assert EventType.EXECUTION_FAILED not in bus._by_type
+
+        await bus.publish(make_event(EventType.EXECUTION_COMPLETED))
+        assert received == []
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_keeps_other_subscriptions(self):
+        bus = EventBus()
+        received: list[str] = []
+
+        async def first(event: AgentEvent) -> None:
+            received.append("first")
+
+        async def second(event: AgentEvent) -> None:
+            received.append("second")
+
+        first_id = bus.subscribe(
+            event_types=[EventType.EXECUTION_COMPLETED], handler=first
+        )
+        bus.subscribe(event_types=[EventType.EXECUTION_COMPLETED], handler=second)
+
+        bus.unsubscribe(first_id)
+        await bus.publish(make_event(EventType.EXECUTION_COMPLETED))
+
+        assert received == ["second"]
+
+    @pytest.mark.asyncio
+    async def test_stream_filter_applies(self):
+        bus = EventBus()
+        received: list[AgentEvent] = []
+
+        async def handler(event: AgentEvent) -> None:
+            received.append(event)
+
+        bus.subscribe(
+            event_types=[EventType.EXECUTION_COMPLETED],
+            handler=handler,
+            filter_stream="stream-1",
+        )
+
+        await bus.publish(make_event(stream_id="stream-1"))
+        await bus.publish(make_event(stream_id="stream-2"))
+
+        assert len(received) == 1
+        assert received[0].stream_id == "stream-1"
+
+    @pytest.mark.asyncio
+    async def test_subscribe_handlers_dispatches_per_type(self):
+        bus = EventBus()
+        received: list[str] = []
+
+        async def on_completed(event: AgentEvent) -> None:
+            received.append("completed")
+
+        async def on_failed(event: AgentEvent) -> None:
+            received.append("failed")
+
+        bus.subscribe_handlers(
+            handlers={
+                EventType.EXECUTION_COMPLETED: on_completed,
+                EventType.EXECUTION_FAILED: on_failed,
+            }
+        )
+
+        await bus.publish(make_event(EventType.EXECUTION_FAILED))
+        await bus.publish(make_event(EventType.EXECUTION_COMPLETED))
+        # Types outside the table are not delivered at all
+        await bus.publish(make_event(EventType.EXECUTION_PAUSED))
+
+        assert sorted(received) == ["completed", "failed"]
+
+
+class TestBackgroundHandlers:
+    """Test ordered=False dispatch and drain()."""
+
+    @pytest.mark.asyncio
+    async def test_unordered_handler_does_not_block_publish(self):
+        bus = EventBus()
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_handler(event: AgentEvent) -> None:
+            started.set()
+            await release.wait()
+
+        bus.subscribe(
+            event_types=[EventType.EXECUTION_COMPLETED],
+            handler=slow_handler,
+            ordered=False,
+        )
+
+        # publish must return while the handler is still blocked
+        await asyncio.wait_for(bus.publish(make_event()), timeout=1)
+        await asyncio.wait_for(started.wait(), timeout=1)
+
+        release.set()
+        await bus.drain()
+
+    @pytest.mark.asyncio
+    async def test_drain_waits_for_background_handlers(self):
+        bus = EventBus()
+        finished: list[int] = []
+
+        async def handler(event: AgentEvent) -> None:
+            await asyncio.sleep(0.05)
+            finished.append(1)
+
+        bus.subscribe(
+            event_types=[EventType.EXECUTION_COMPLETED],
+            handler=handler,
+            ordered=False,
+        )
+
+        await bus.publish(make_event())
+        assert finished == []
+
+        await bus.drain()
+        assert finished == [1]
+
+    @pytest.mark.asyncio
+    async def test_drain_with_no_pending_handlers_returns(self):
+        bus = EventBus()
+        await asyncio.wait_for(bus.drain(), timeout=1)
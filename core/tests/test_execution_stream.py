@@ -1,6 +1,8 @@
-"""Tests for ExecutionStream retention behavior."""
+"""Tests for ExecutionStream retention and guard termination behavior."""
 
+import asyncio
 import json
+import time
 from collections.abc import Callable
 
 import pytest
@@ -8,7 +10,9 @@ import pytest
 from framework.graph import Goal, NodeSpec, SuccessCriterion
 from framework.graph.edge import GraphSpec
 from framework.llm.provider import LLMProvider, LLMResponse, Tool
-from framework.runtime.event_bus import EventBus
+from framework.runtime.cancellation import CancellationToken
+from framework.runtime.event_bus import EventBus, EventType
+from framework.runtime.execution_guard import ExecutionLimitConfig
 from framework.runtime.execution_stream import EntryPointSpec, ExecutionStream
 from framework.runtime.outcome_aggregator import OutcomeAggregator
 from framework.runtime.shared_state import SharedStateManager
@@ -120,3 +124,135 @@ async def test_execution_stream_retention(tmp_path):
 
     await stream.stop()
     await storage.stop()
+
+
+class SlowLLMProvider(LLMProvider):
+    """LLM provider that blocks long enough for the guard to fire."""
+
+    def complete(
+        self,
+        messages: list[dict[str, object]],
+        system: str = "",
+        tools: list[Tool] | None = None,
+        max_tokens: int = 1024,
+        response_format: dict[str, object] | None = None,
+        json_mode: bool = False,
+        cancellation_token: CancellationToken | None = None,
+    ) -> LLMResponse:
+        if cancellation_token is not None:
+            cancellation_token.wait(2)
+        else:
+            time.sleep(2)
+        return LLMResponse(content=json.dumps({"result": "ok"}), model="slow")
+
+    def complete_with_tools(
+        self,
+        messages: list[dict[str, object]],
+        system: str,
+        tools: list[Tool],
+        tool_executor: Callable,
+        max_iterations: int = 10,
+        cancellation_token: CancellationToken | None = None,
+    ) -> LLMResponse:
+        if cancellation_token is not None:
+            cancellation_token.wait(2)
+        else:
+            time.sleep(2)
+        return LLMResponse(content=json.dumps({"result": "ok"}), model="slow")
+
+
+@pytest.mark.asyncio
+async def test_guard_terminates_slow_execution(tmp_path):
+    """A runtime-limited execution is cancelled and EXECUTION_TERMINATED published."""
+    goal = Goal(
+        id="guard-goal",
+        name="Guard Goal",
+        description="Guard termination test",
+        success_criteria=[
+            SuccessCriterion(
+                id="result",
+                description="Result present",
+                metric="output_contains",
+                target="result",
+            )
+        ],
+        constraints=[],
+    )
+
+    node = NodeSpec(
+        id="slow",
+        name="Slow",
+        description="Blocks past the deadline",
+        node_type="llm_generate",
+        input_keys=["user_name"],
+        output_keys=["result"],
+        system_prompt='Return JSON: {"result": "ok"}',
+    )
+
+    graph = GraphSpec(
+        id="guard-graph",
+        goal_id=goal.id,
+        version="1.0.0",
+        entry_node="slow",
+        entry_points={"start": "slow"},
+        terminal_nodes=["slow"],
+        pause_nodes=[],
+        nodes=[node],
+        edges=[],
+        default_model="slow",
+        max_tokens=10,
+    )
+
+    event_bus = EventBus()
+    terminated: list = []
+    got_terminated = asyncio.Event()
+
+    async def on_terminated(event):
+        terminated.append(event)
+        got_terminated.set()
+
+    event_bus.subscribe(
+        event_types=[EventType.EXECUTION_TERMINATED],
+        handler=on_terminated,
+    )
+
+    storage = ConcurrentStorage(tmp_path)
+    await storage.start()
+
+    stream = ExecutionStream(
+        stream_id="start",
+        entry_spec=EntryPointSpec(
+            id="start",
+            name="Start",
+            entry_node="slow",
+            trigger_type="manual",
+            isolation_level="shared",
+        ),
+        graph=graph,
+        goal=goal,
+        state_manager=SharedStateManager(),
+        storage=storage,
+        outcome_aggregator=OutcomeAggregator(goal, event_bus),
+        event_bus=event_bus,
+        llm=SlowLLMProvider(),
+        tools=[],
+        tool_executor=None,
+        guard_config=ExecutionLimitConfig(max_runtime_ms=200),
+    )
+
+    await stream.start()
+
+    execution_id = await stream.execute({"user_name": "guarded"})
+    result = await stream.wait_for_completion(execution_id, timeout=5)
+
+    # Guard-terminated executions produce no result
+    assert result is None
+
+    # The termination event carries the execution and the tripped limit
+    await asyncio.wait_for(got_terminated.wait(), timeout=2)
+    assert len(terminated) == 1
+    assert terminated[0].execution_id == execution_id
+    assert terminated[0].data["reason"] == "TIME_LIMIT_EXCEEDED"
+
+    await stream.stop()
+    await storage.stop()
@@ -0,0 +1,155 @@
+"""Tests for AsyncLLMAdapter thread offloading and token forwarding."""
+
+import threading
+from collections.abc import Callable
+
+import pytest
+
+from framework.llm.provider import AsyncLLMAdapter, LLMProvider, LLMResponse, Tool
+from framework.runtime.cancellation import CancellationToken
+
+
+class RecordingProvider(LLMProvider):
+    """Provider that records how it was called."""
+
+    def __init__(self):
+        self.seen_token = None
+        self.call_thread = None
+
+    def complete(
+        self,
+        messages: list[dict[str, object]],
+        system: str = "",
+        tools: list[Tool] | None = None,
+        max_tokens: int = 1024,
+        response_format: dict[str, object] | None = None,
+        json_mode: bool = False,
+        cancellation_token: CancellationToken | None = None,
+    ) -> LLMResponse:
+        self.seen_token = cancellation_token
+        self.call_thread = threading.current_thread()
+        return LLMResponse(content="ok", model="recording")
+
+    def complete_with_tools(
+        self,
+        messages: list[dict[str, object]],
+        system: str,
+        tools: list[Tool],
+        tool_executor: Callable,
+        max_iterations: int = 10,
+        cancellation_token: CancellationToken | None = None,
+    ) -> LLMResponse:
+        self.seen_token = cancellation_token
+        self.call_thread = threading.current_thread()
+        return LLMResponse(content="ok", model="recording")
+
+
+class LegacyProvider(LLMProvider):
+    """Provider written before cancellation_token existed."""
+
+    def complete(
+        self,
+        messages: list[dict[str, object]],
+        system: str = "",
+        tools: list[Tool] | None = None,
+        max_tokens: int = 1024,
+        response_format: dict[str, object] | None = None,
+        json_mode: bool = False,
+    ) -> LLMResponse:
+        return LLMResponse(content="legacy", model="legacy")
+
+    def complete_with_tools(
+        self,
+        messages: list[dict[str, object]],
+        system: str,
+        tools: list[Tool],
+        tool_executor: Callable,
+        max_iterations: int = 10,
+    ) -> LLMResponse:
+        return LLMResponse(content="legacy", model="legacy")
+
+
+@pytest.mark.asyncio
+async def test_complete_runs_in_worker_thread():
+    """The sync provider call must not run on the event loop's thread."""
+    provider = RecordingProvider()
+    adapter = AsyncLLMAdapter(provider)
+
+    response = await adapter.complete([{"role": "user", "content": "hi"}])
+
+    assert response.content == "ok"
+    assert provider.call_thread is not None
+    assert provider.call_thread is not threading.current_thread()
+
+
+@pytest.mark.asyncio
+async def test_complete_with_tools_runs_in_worker_thread():
+    provider = RecordingProvider()
+    adapter = AsyncLLMAdapter(provider)
+
+    response = await adapter.complete_with_tools(
+        [{"role": "user", "content": "hi"}],
+        system="",
+        tools=[],
+        tool_executor=lambda tool_use: None,
+    )
+
+    assert response.content == "ok"
+    assert provider.call_thread is not threading.current_thread()
+
+
+@pytest.mark.asyncio
+async def test_forwards_token_when_provider_accepts_it():
+    provider = RecordingProvider()
+    token = CancellationToken()
+    adapter = AsyncLLMAdapter(provider, cancellation_token=token)
+
+    await adapter.complete([{"role": "user", "content": "hi"}])
+
+    assert provider.seen_token is token
+
+
+@pytest.mark.asyncio
+async def test_skips_token_for_legacy_provider():
+    """Providers without the kwarg must not receive it (no TypeError)."""
+    adapter = AsyncLLMAdapter(LegacyProvider(), cancellation_token=CancellationToken())
+
+    response = await adapter.complete([{"role": "user", "content": "hi"}])
+
+    assert response.content == "legacy"
+
+
+@pytest.mark.asyncio
+async def test_explicit_token_argument_wins():
+    """A token passed at the call site overrides the adapter's default."""
+    provider = RecordingProvider()
+    adapter = AsyncLLMAdapter(provider, cancellation_token=CancellationToken())
+
+    call_token = CancellationToken()
+    await adapter.complete(
+        [{"role": "user", "content": "hi"}],
+        cancellation_token=call_token,
+    )
+
+    assert provider.seen_token is call_token
+
+
+def test_wrap_passes_through_existing_adapter():
+    provider = RecordingProvider()
+    adapter = AsyncLLMAdapter(provider)
+
+    rewrapped = AsyncLLMAdapter.wrap(adapter)
+    assert rewrapped is adapter
+
+    token = CancellationToken()
+    rewrapped = AsyncLLMAdapter.wrap(adapter, cancellation_token=token)
+    assert rewrapped is adapter
+    assert adapter.cancellation_token is token
+
+
+def test_wrap_creates_adapter_and_exposes_provider():
+    provider = RecordingProvider()
+    adapter = AsyncLLMAdapter.wrap(provider)
+
+    assert isinstance(adapter, AsyncLLMAdapter)
+    assert adapter.provider is provider
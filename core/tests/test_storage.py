@@ -1,5 +1,6 @@
 """Tests for the storage module - FileStorage and ConcurrentStorage backends."""
 
+import asyncio
 import json
 import time
 from pathlib import Path
@@ -8,7 +9,7 @@ import pytest
 
 from framework.schemas.run import Run, RunMetrics, RunStatus
 from framework.storage.backend import FileStorage
-from framework.storage.concurrent import CacheEntry, ConcurrentStorage
+from framework.storage.concurrent import CacheEntry, ConcurrentStorage, get_shared_storage
 
 # === HELPER FUNCTIONS ===
 
@@ -618,3 +619,34 @@ class TestConcurrentStorageStats:
             assert stats["running"] is True
         finally:
             await storage.stop()
+
+
+class TestSharedStorage:
+    """Test the process-wide shared storage factory."""
+
+    def test_get_shared_storage_returns_same_instance(self, tmp_path: Path):
+        """Same path (str or Path) yields the same instance."""
+        assert get_shared_storage(tmp_path) is get_shared_storage(str(tmp_path))
+
+    def test_restart_across_event_loops_flushes_writes(self, tmp_path: Path):
+        """A shared instance restarted in a new loop must still flush.
+
+        The write queue and locks bind to the loop they first run in;
+        start() rebuilds them so a restart from a fresh asyncio.run loop
+        (e.g. a rerun Streamlit script) doesn't leave the batch writer
+        spinning on a queue bound to the dead loop.
+        """
+        storage = get_shared_storage(tmp_path)
+
+        def run_once(run_id: str) -> Run | None:
+            async def go() -> Run | None:
+                await storage.ensure_started()
+                await storage.save_run(create_test_run(run_id=run_id))
+                await storage.stop()
+                return await storage.load_run(run_id, use_cache=False)
+
+            return asyncio.run(go())
+
+        assert run_once("run_loop_1") is not None
+        # Second run uses a brand-new event loop
+        assert run_once("run_loop_2") is not None